@@ -11,6 +11,7 @@ setup_logger()
 from .endpoints.routes import api_router  # noqa: E402
 from .repository.core import init_db, update_statusses  # noqa: E402
 from .schedulers.core import start_scheduler  # noqa: E402
+from .services.higgsfield import close_http_client, close_playwright  # noqa: E402
 
 logger = logging.getLogger("higgsfield")
 
@@ -22,6 +23,8 @@ def create_app() -> FastAPI:
         start_scheduler()
         await update_statusses()
         yield
+        await close_http_client()
+        await close_playwright()
 
     app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
     app.include_router(api_router)
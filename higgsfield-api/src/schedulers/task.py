@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 import httpx
+import orjson
 
 # Add parent directories to path for config import
 _APP_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -18,13 +19,16 @@ from config import TASK_STATUS_REQUEST_DELAY
 from ..repository.models.account import HiggsfieldAccount
 from ..repository.models.task import Task
 from ..services.higgsfield import (
+    JOB_SUBMIT_TIMEOUT,
     ensure_authenticated_account,
     generate_image,
     generate_video,
     get_account_info,
+    get_http_client,
     get_job_set_id,
     get_last_used_account,
     get_token,
+    invalidate_token,
 )
 
 logger = logging.getLogger("higgsfield")
@@ -218,18 +222,27 @@ async def process_soul_tasks(task: Task):
 
         token = await get_token(account)
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            url = "https://fnf.higgsfield.ai/jobs/text2image-soul"
-            headers = {"Authorization": f"Bearer {token}"}
+        client = get_http_client()
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
 
-            logger.debug(f"Soul model payload: {payload}")
+        logger.debug(f"Soul model payload: {payload}")
 
-            res = await client.post(url, headers=headers, json=payload)
-            res.raise_for_status()
+        res = await client.post(
+            "/jobs/text2image-soul",
+            headers=headers,
+            content=orjson.dumps(payload),
+            timeout=JOB_SUBMIT_TIMEOUT,
+        )
+        res.raise_for_status()
 
-            job_set = res.json()
+        job_set = orjson.loads(res.content)
 
     except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            invalidate_token(account.id)
         logger.error(f"Soul API error: {e.response.status_code} - {e.response.text}")
         task.status = "failed"
         task.message = f"Soul API error: {e.response.status_code}"
@@ -346,7 +359,8 @@ async def update_account_balance():
     accounts = await HiggsfieldAccount.filter(is_active=True)
     for account in accounts:
         try:
-            response = await get_account_info(account)
+            # Runs far less often than USER_INFO_TTL; always fetch fresh balances
+            response = await get_account_info(account, force=True)
             account.balance = response.get("subscription_credits")
             account.subscription = response.get("plan_type")
             account.subscription_end_at = response.get("plan_ends_at")
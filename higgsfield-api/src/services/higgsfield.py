@@ -1,17 +1,47 @@
 #!/usr/bin/env python3
+import asyncio
 import base64
-import json
+import concurrent.futures
+import functools
 import logging
 import random
+import stat
+import struct
+import time
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
 
+import aiofiles
+import aiofiles.os
 import httpx
-from PIL import Image
-# Note: playwright.sync_api is imported inside _refresh_account_auth_sync to avoid startup issues
+import orjson
+# Note: playwright.sync_api is imported inside _get_playwright, on the Playwright
+# worker thread, the first time an auth refresh runs. Token, upload and generation
+# calls never import it, so neither app startup nor the request path pays for it.
 
 from config import APP_ORIGIN, CLERK_APIVER, CLERK_BASE, CLERK_JSVER
+from src.utils.cookies import (
+    find_cookie,
+    hf_cookie_entries,
+    index_cookies,
+    is_hf_domain,
+    load_hf_cookies,
+)
 from src.utils.exceptions import (
     APIRequestError,
     AuthStorageError,
@@ -225,11 +255,168 @@ MOTION_ID_PARAMS = {
 #    'params': {'steps': 20, 'frames': 81, 'strength': 1.0, 'guide_scale': 6.0}}]
 
 
+# Reverse index so callers can pass a preset's UUID as well as its name
+_MOTION_BY_ID = {params["id"]: params for params in MOTION_ID_PARAMS.values()}
+
+
 FRAME_MAPPING = {
     "3": 49,
     "5": 81,
 }
 
+FNF_BASE = "https://fnf.higgsfield.ai"
+
+# Fixed query params and headers for the Clerk session/token endpoints
+_CLERK_PARAMS = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
+_CLERK_JSON_HEADERS = {
+    "Accept": "application/json",
+    "Origin": APP_ORIGIN,
+    "Referer": f"{APP_ORIGIN}/",
+}
+_CLERK_FORM_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "*/*",
+    "Origin": APP_ORIGIN,
+    "Referer": f"{APP_ORIGIN}/",
+}
+# Optional: look a bit more like a browser
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/141.0"
+}
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_URL_REQUIRED_FIELDS = frozenset({"upload_url", "id", "url", "content_type"})
+# SOFn-range markers that are not frame headers (DHT, JPG, DAC)
+JPEG_NON_SOF_MARKERS = frozenset({0xC4, 0xC8, 0xCC})
+
+# Transient upstream failures worth retrying on job submission. Job POSTs spend
+# credits, so only failures where the request never reached the API qualify. A
+# read timeout or a 504 (the gateway gave up waiting on the API) may mean the
+# job was already accepted, so those count as failures but are never replayed.
+RETRYABLE_STATUS_CODES = frozenset({502, 503})
+AMBIGUOUS_STATUS_CODES = frozenset({504})
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+SUBMIT_ATTEMPTS = 3
+
+# Per-phase timeouts: small JSON calls (API, Clerk) fail fast on every phase, while
+# the pre-signed image PUT gets long read/write windows for large files. Job
+# submissions keep the original 120s read window: the server may take a while to
+# accept a job, and a read timeout there is not retried (see RETRYABLE_ERRORS).
+JSON_TIMEOUT = httpx.Timeout(30, connect=5, write=10, pool=5)
+JOB_SUBMIT_TIMEOUT = httpx.Timeout(120, connect=5, write=10, pool=5)
+UPLOAD_PUT_TIMEOUT = httpx.Timeout(120, connect=5, pool=5)
+# End-to-end bound on upload_image (URL request, PUT and completion call)
+UPLOAD_TIMEOUT = 300
+
+
+class _CircuitBreaker:
+    """Per-host circuit breaker for job submission requests.
+
+    Opens after ``threshold`` failures within ``window`` seconds and rejects
+    requests for ``cooldown`` seconds. The first request after the cooldown is
+    let through as a single probe (half-open) and every other request is rejected
+    until its result is recorded; a failed probe re-opens the circuit immediately.
+    """
+
+    def __init__(
+        self, threshold: int = 5, window: float = 30.0, cooldown: float = 10.0
+    ):
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._failures: Dict[str, List[float]] = {}
+        self._open_until: Dict[str, float] = {}
+        self._half_open: Set[str] = set()
+
+    def allow_request(self, host: str) -> bool:
+        if host in self._half_open:
+            return False
+        open_until = self._open_until.get(host)
+        if open_until is None:
+            return True
+        if time.monotonic() < open_until:
+            return False
+        del self._open_until[host]
+        self._half_open.add(host)
+        return True
+
+    def release(self, host: str) -> None:
+        """Give up a half-open probe that ended without a result."""
+        if host in self._half_open:
+            self._half_open.discard(host)
+            self._open_until[host] = time.monotonic()
+
+    def record_success(self, host: str) -> None:
+        self._failures.pop(host, None)
+        self._half_open.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        now = time.monotonic()
+        if host in self._half_open:
+            self._half_open.discard(host)
+            self._open_until[host] = now + self.cooldown
+            return
+
+        failures = [t for t in self._failures.get(host, []) if now - t < self.window]
+        failures.append(now)
+        if len(failures) >= self.threshold:
+            logger.warning(
+                "Circuit breaker opened for %s after %d failures", host, len(failures)
+            )
+            self._failures.pop(host, None)
+            self._open_until[host] = now + self.cooldown
+        else:
+            self._failures[host] = failures
+
+
+_circuit_breaker = _CircuitBreaker()
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client used for Higgsfield API and upload calls.
+
+    Reusing one client keeps connections to fnf.higgsfield.ai alive between calls
+    instead of paying a TCP + TLS handshake per request, and HTTP/2 lets parallel
+    job submissions share one connection (servers without h2 get HTTP/1.1). Paths
+    are relative to ``FNF_BASE``; absolute URLs (e.g. pre-signed uploads) are used
+    as-is.
+
+    The client is shared by all accounts, so the bearer token is passed per request
+    rather than bound to the client (tokens also rotate every minute or so), and
+    it refuses to store response cookies so nothing leaks between accounts.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=FNF_BASE,
+            http2=True,
+            timeout=JSON_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=60
+            ),
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client; called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _build_cookiejar(entries: List[Tuple[str, str, str, str]]) -> httpx.Cookies:
+    """Build and index a cookie jar from pre-validated cookie tuples."""
+    jar = httpx.Cookies()
+    for name, value, domain, path in entries:
+        jar.set(name, value, domain=domain, path=path)
+    index_cookies(jar, jar.jar)
+    return jar
+
 
 def load_cookiejar(storage_path: Path) -> httpx.Cookies:
     """Load cookies from auth storage file.
@@ -246,41 +433,37 @@ def load_cookiejar(storage_path: Path) -> httpx.Cookies:
     """
     try:
         if not storage_path.exists():
-            logger.error(f"Auth file not found at {storage_path}")
+            logger.error("Auth file not found at %s", storage_path)
             raise AuthStorageError(f"Auth file not found at {storage_path}")
 
         try:
-            state = json.loads(storage_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.error(f"Invalid auth file format: {e}")
+            state = orjson.loads(storage_path.read_bytes())
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid auth file format: %s", e)
             raise AuthStorageError(f"Invalid auth file format: {e}")
 
-        jar = httpx.Cookies()
         cookies = state.get("cookies", [])
 
         if not isinstance(cookies, list):
             logger.error("Invalid cookies format in auth file")
             raise AuthStorageError("Invalid cookies format in auth file")
 
-        for c in cookies:
-            try:
-                # Keep all cookies for higgsfield.ai and clerk.higgsfield.ai (and subdomains)
-                dom = c.get("domain", "")
-                if "higgsfield.ai" in dom:
-                    jar.set(c["name"], c["value"], domain=dom, path=c.get("path", "/"))
-            except Exception as e:
-                logger.warning(f"Failed to set cookie {c.get('name', 'unknown')}: {e}")
-                continue
-
-        return jar
+        return _build_cookiejar(hf_cookie_entries(cookies))
     except Exception as e:
-        logger.error(f"Failed to load cookies from auth file: {e}")
+        logger.error("Failed to load cookies from auth file: %s", e)
         raise AuthStorageError(f"Failed to load cookies from auth file: {e}")
 
 
+# Parsed jars per account id, with the serialized cookies_json they were built from
+_jar_cache: Dict[int, Tuple[bytes, httpx.Cookies]] = {}
+
+
 def load_cookiejar_from_account(account: HiggsfieldAccount) -> httpx.Cookies:
     """Load cookies from account's cookies_json field.
 
+    The jar is cached per account and rebuilt only when cookies_json changes, so
+    callers must not modify it.
+
     Args:
         account: HiggsfieldAccount instance with cookies_json
 
@@ -291,26 +474,24 @@ def load_cookiejar_from_account(account: HiggsfieldAccount) -> httpx.Cookies:
         AuthStorageError: If account cookies are invalid
     """
     try:
-        jar = httpx.Cookies()
         cookies = account.cookies_json
 
         if not isinstance(cookies, list):
             logger.error("Invalid cookies format in account")
             raise AuthStorageError("Invalid cookies format in account")
 
-        for c in cookies:
-            try:
-                # Keep all cookies for higgsfield.ai and clerk.higgsfield.ai (and subdomains)
-                dom = c.get("domain", "")
-                if "higgsfield.ai" in dom:
-                    jar.set(c["name"], c["value"], domain=dom, path=c.get("path", "/"))
-            except Exception as e:
-                logger.warning(f"Failed to set cookie {c.get('name', 'unknown')}: {e}")
-                continue
+        # Serialized cookies are the cache version: a C-level dump + bytes compare
+        # is much cheaper than rebuilding the http.cookiejar jar
+        version = orjson.dumps(cookies)
+        cached = _jar_cache.get(account.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
+        jar = _build_cookiejar(hf_cookie_entries(cookies))
+        _jar_cache[account.id] = (version, jar)
         return jar
     except Exception as e:
-        logger.error(f"Failed to load cookies from account: {e}")
+        logger.error("Failed to load cookies from account: %s", e)
         raise AuthStorageError(f"Failed to load cookies from account: {e}")
 
 
@@ -331,19 +512,29 @@ def get_cookie(
         CookieParsingError: If cookie access fails
     """
     try:
-        for c in jar.jar:
-            if c.name == name and (
-                domain_contains is None or domain_contains in c.domain
-            ):
-                return c.value
-        return None
+        return find_cookie(jar, jar.jar, name, domain_contains)
     except Exception as e:
         raise CookieParsingError(f"Failed to access cookie '{name}': {e}")
 
 
-def b64url_decode(s: str) -> bytes:
-    s += "=" * (-len(s) % 4)
-    return base64.urlsafe_b64decode(s.encode("utf-8"))
+def b64url_decode(s: Union[str, bytes]) -> bytes:
+    if isinstance(s, str):
+        s = s.encode("ascii")
+    return base64.urlsafe_b64decode(s + b"=" * (-len(s) & 3))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_jwt_payload(token: str) -> Dict[str, Any]:
+    """Decode a JWT's payload segment.
+
+    Cached because the same __session cookie is re-parsed on every token request
+    until the account's cookies change. Payloads that can't contain a Clerk session
+    id are returned as an empty dict without being JSON-parsed.
+    """
+    raw = b64url_decode(token.split(".")[1])
+    if b"sess_" not in raw:
+        return {}
+    return orjson.loads(raw)
 
 
 def try_session_id_from_clerk_active_context(jar: httpx.Cookies) -> Optional[str]:
@@ -363,7 +554,7 @@ def try_session_id_from_clerk_active_context(jar: httpx.Cookies) -> Optional[str
         sid = v.split(":", 1)[0].strip()
         return sid if sid.startswith("sess_") else None
     except Exception as e:
-        logger.warning(f"Failed to parse clerk_active_context cookie: {e}")
+        logger.warning("Failed to parse clerk_active_context cookie: %s", e)
         return None
 
 
@@ -385,19 +576,19 @@ def try_session_id_from___session_jwt(jar: httpx.Cookies) -> Optional[str]:
 
             parts = tok.split(".")
             if len(parts) < 2:
-                logger.warning(f"Invalid JWT format in {name} cookie")
+                logger.warning("Invalid JWT format in %s cookie", name)
                 continue
 
-            payload = json.loads(b64url_decode(parts[1]).decode("utf-8"))
+            payload = _parse_jwt_payload(tok)
             sid = payload.get("sid")
             if isinstance(sid, str) and sid.startswith("sess_"):
                 return sid
 
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.warning(f"Failed to decode JWT from {name} cookie: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to decode JWT from %s cookie: %s", name, e)
             continue
         except Exception as e:
-            logger.warning(f"Unexpected error parsing {name} cookie: {e}")
+            logger.warning("Unexpected error parsing %s cookie: %s", name, e)
             continue
 
     return None
@@ -418,20 +609,13 @@ async def get_session_id_via_api(client: httpx.AsyncClient) -> Optional[str]:
     try:
         # Fallback: GET /v1/client and pick last_active_session_id or an active session
         url = f"{CLERK_BASE}/v1/client"
-        params = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
-        headers = {
-            "Accept": "application/json",
-            "Origin": APP_ORIGIN,
-            "Referer": f"{APP_ORIGIN}/",
-        }
-
-        r = await client.get(url, params=params, headers=headers, timeout=120)
+        r = await client.get(url, params=_CLERK_PARAMS, headers=_CLERK_JSON_HEADERS)
         r.raise_for_status()
 
         try:
-            j = r.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from Clerk API: {e}")
+            j = orjson.loads(r.content)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON response from Clerk API: %s", e)
             raise SessionError(f"Invalid JSON response from Clerk API: {e}")
 
         client_data = None
@@ -451,19 +635,19 @@ async def get_session_id_via_api(client: httpx.AsyncClient) -> Optional[str]:
         if sid:
             return sid
 
-        # Try active sessions
+        # Try active sessions, then fall back to the first session
         sessions = client_data.get("sessions") or []
-        for s in sessions:
-            if s.get("status") == "active" and isinstance(s.get("id"), str):
-                return s["id"]
-
-        # Fallback to any session
-        if sessions:
-            first_session_id = sessions[0].get("id")
-            if isinstance(first_session_id, str):
-                return first_session_id
-
-        return None
+        sid = next(
+            (
+                s["id"]
+                for s in sessions
+                if s.get("status") == "active" and isinstance(s.get("id"), str)
+            ),
+            None,
+        )
+        if sid is None and sessions:
+            sid = sessions[0].get("id")
+        return sid if isinstance(sid, str) else None
 
     except httpx.HTTPStatusError as e:
         raise SessionError(
@@ -490,27 +674,24 @@ async def mint_session_token(client: httpx.AsyncClient, session_id: str) -> str:
     """
     try:
         url = f"{CLERK_BASE}/v1/client/sessions/{session_id}/tokens"
-        params = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "*/*",
-            "Origin": APP_ORIGIN,
-            "Referer": f"{APP_ORIGIN}/",
-        }
-
         # Try without any form data - Clerk API doesn't accept action parameter
-        r = await client.post(url, params=params, headers=headers, timeout=120)
+        r = await client.post(url, params=_CLERK_PARAMS, headers=_CLERK_FORM_HEADERS)
         r.raise_for_status()
 
         try:
-            data = r.json()
-        except json.JSONDecodeError as e:
+            data = orjson.loads(r.content)
+        except orjson.JSONDecodeError as e:
             raise TokenMintError(f"Invalid JSON response from token mint API: {e}")
 
         # Look for token in various possible fields
-        for key in ("jwt", "token", "client_jwt", "session_token"):
-            if key in data and isinstance(data[key], str) and data[key]:
-                return data[key]
+        token = (
+            data.get("jwt")
+            or data.get("token")
+            or data.get("client_jwt")
+            or data.get("session_token")
+        )
+        if isinstance(token, str) and token:
+            return token
 
         raise TokenMintError(
             f"No valid token found in response. Available keys: {list(data.keys())}"
@@ -525,13 +706,48 @@ async def mint_session_token(client: httpx.AsyncClient, session_id: str) -> str:
     except TokenMintError:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error minting token: {e}")
+        logger.error("Unexpected error minting token: %s", e)
         raise TokenMintError(f"Unexpected error minting token: {e}")
 
 
+# Minted Clerk tokens per account id: (token, unix time after which it is stale)
+_token_cache: Dict[int, Tuple[str, float]] = {}
+TOKEN_EXPIRY_MARGIN = 5
+# In-flight mints keyed by account id, so concurrent cache misses share one mint
+_token_inflight: Dict[int, "asyncio.Future[str]"] = {}
+
+
+def _token_expires_at(token: str) -> float:
+    """Read the ``exp`` claim of a JWT, returning 0 if it can't be determined."""
+    try:
+        payload = orjson.loads(b64url_decode(token.split(".")[1]))
+        return float(payload["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def invalidate_token(account_id: int) -> None:
+    """Drop the cached token and cookie jar for an account.
+
+    The next call re-parses the account's cookies and mints a fresh token.
+    """
+    _token_cache.pop(account_id, None)
+    _jar_cache.pop(account_id, None)
+
+
+def _raise_for_status(res: httpx.Response, account: HiggsfieldAccount) -> None:
+    """``raise_for_status`` that also drops the account's cached token on a 401."""
+    if res.status_code == 401:
+        invalidate_token(account.id)
+    res.raise_for_status()
+
+
 async def get_token(account: HiggsfieldAccount) -> str:
     """Get authentication token for Higgsfield API.
 
+    Tokens are cached per account until shortly before their ``exp`` claim, and
+    concurrent cache misses for the same account are coalesced into one mint.
+
     Args:
         account: HiggsfieldAccount instance containing cookies_json
 
@@ -543,21 +759,34 @@ async def get_token(account: HiggsfieldAccount) -> str:
         SessionError: If session management fails
         TokenMintError: If token minting fails
     """
+    cached = _token_cache.get(account.id)
+    if cached and time.time() < cached[1]:
+        return cached[0]
+
+    mint = _token_inflight.get(account.id)
+    if mint is None:
+        mint = asyncio.ensure_future(_mint_token(account))
+        _token_inflight[account.id] = mint
+        mint.add_done_callback(lambda _: _token_inflight.pop(account.id, None))
+
+    # Shield so a cancelled caller doesn't abort the mint others are waiting on
+    return await asyncio.shield(mint)
+
+
+async def _mint_token(account: HiggsfieldAccount) -> str:
+    """Resolve the Clerk session for ``account`` and mint a fresh token."""
     try:
         jar = load_cookiejar_from_account(account)
     except Exception as e:
-        logger.error(f"Failed to load authentication cookies from account: {e}")
+        logger.error("Failed to load authentication cookies from account: %s", e)
         raise AuthStorageError(
             f"Failed to load authentication cookies from account: {e}"
         )
 
-    # Optional: look a bit more like a browser
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/141.0"
-    }
-
     try:
-        async with httpx.AsyncClient(cookies=jar, headers=headers) as client:
+        async with httpx.AsyncClient(
+            cookies=jar, headers=_BROWSER_HEADERS, timeout=JSON_TIMEOUT
+        ) as client:
             # 1) Fast path: cookie value
             sid = try_session_id_from_clerk_active_context(jar)
 
@@ -570,7 +799,7 @@ async def get_token(account: HiggsfieldAccount) -> str:
                 try:
                     sid = await get_session_id_via_api(client)
                 except SessionError as e:
-                    logger.error(f"Failed to get session ID via API: {e}")
+                    logger.error("Failed to get session ID via API: %s", e)
                     raise
 
             if not sid:
@@ -580,15 +809,19 @@ async def get_token(account: HiggsfieldAccount) -> str:
 
             try:
                 token = await mint_session_token(client, sid)
+                _token_cache[account.id] = (
+                    token,
+                    _token_expires_at(token) - TOKEN_EXPIRY_MARGIN,
+                )
                 return token
             except TokenMintError as e:
-                logger.error(f"Token minting failed: {e}")
+                logger.error("Token minting failed: %s", e)
                 raise
 
     except (SessionError, TokenMintError):
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during token acquisition: {e}")
+        logger.error("Unexpected error during token acquisition: %s", e)
         raise SessionError(f"Unexpected error during token acquisition: {e}")
 
 
@@ -613,21 +846,21 @@ async def get_job_set_id(job_set_id: str, account: HiggsfieldAccount) -> Dict[st
     try:
         token = await get_token(account)
 
-        async with httpx.AsyncClient() as client:
-            url = f"https://fnf.higgsfield.ai/job-sets/{job_set_id}"
-            headers = {"Authorization": f"Bearer {token}"}
+        client = get_http_client()
+        url = f"/job-sets/{job_set_id}"
+        headers = {"Authorization": f"Bearer {token}"}
 
-            res = await client.get(url, headers=headers, timeout=120)
-            res.raise_for_status()
+        res = await client.get(url, headers=headers)
+        _raise_for_status(res, account)
 
-            try:
-                data = res.json()
-                logger.info(f"Successfully retrieved job set {job_set_id}")
-                return data
-            except json.JSONDecodeError as e:
-                raise APIRequestError(
-                    f"Invalid JSON response from job set API: {e}", res.status_code
-                )
+        try:
+            data = orjson.loads(res.content)
+            logger.info("Successfully retrieved job set %s", job_set_id)
+            return data
+        except orjson.JSONDecodeError as e:
+            raise APIRequestError(
+                f"Invalid JSON response from job set API: {e}", res.status_code
+            )
 
     except httpx.HTTPStatusError as e:
         raise APIRequestError(
@@ -668,24 +901,22 @@ async def get_motions(
     try:
         token = await get_token(account)
 
-        async with httpx.AsyncClient() as client:
-            url = "https://fnf.higgsfield.ai/motions"
-            params = {"size": size, "search": "", "preset_family": preset_family}
-            headers = {"Authorization": f"Bearer {token}"}
+        client = get_http_client()
+        url = "/motions"
+        params = {"size": size, "search": "", "preset_family": preset_family}
+        headers = {"Authorization": f"Bearer {token}"}
 
-            res = await client.get(url, params=params, headers=headers, timeout=120)
-            res.raise_for_status()
+        res = await client.get(url, params=params, headers=headers)
+        _raise_for_status(res, account)
 
-            try:
-                data = res.json()
-                logger.info(
-                    f"Successfully retrieved {len(data.get('items', []))} motions"
-                )
-                return data
-            except json.JSONDecodeError as e:
-                raise APIRequestError(
-                    f"Invalid JSON response from motions API: {e}", res.status_code
-                )
+        try:
+            data = orjson.loads(res.content)
+            logger.info("Successfully retrieved %s motions", len(data.get("items", [])))
+            return data
+        except orjson.JSONDecodeError as e:
+            raise APIRequestError(
+                f"Invalid JSON response from motions API: {e}", res.status_code
+            )
 
     except httpx.HTTPStatusError as e:
         raise APIRequestError(
@@ -698,7 +929,7 @@ async def get_motions(
     except (SessionError, TokenMintError, AuthStorageError):
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting motions: {e}")
+        logger.error("Unexpected error getting motions: %s", e)
         raise APIRequestError(f"Unexpected error getting motions: {e}")
 
 
@@ -717,36 +948,33 @@ async def get_upload_url(account: HiggsfieldAccount) -> Dict[str, Any]:
     try:
         token = await get_token(account)
 
-        async with httpx.AsyncClient() as client:
-            url = "https://fnf.higgsfield.ai/media"
-            headers = {"Authorization": f"Bearer {token}"}
-
-            res = await client.post(url, headers=headers, timeout=120)
-            res.raise_for_status()
+        client = get_http_client()
+        url = "/media"
+        headers = {"Authorization": f"Bearer {token}"}
 
-            try:
-                data = res.json()
-
-                # Validate required fields
-                required_fields = ["upload_url", "id", "url", "content_type"]
-                missing_fields = [
-                    field for field in required_fields if field not in data
-                ]
-                if missing_fields:
-                    raise APIRequestError(
-                        f"Upload URL response missing fields: {missing_fields}"
-                    )
+        res = await client.post(url, headers=headers)
+        _raise_for_status(res, account)
 
-                logger.info(
-                    f"Successfully obtained upload URL for media ID: {data.get('id')}"
-                )
-                return data
+        try:
+            data = orjson.loads(res.content)
 
-            except json.JSONDecodeError as e:
+            # Validate required fields
+            if not UPLOAD_URL_REQUIRED_FIELDS.issubset(data):
+                missing_fields = sorted(UPLOAD_URL_REQUIRED_FIELDS - data.keys())
                 raise APIRequestError(
-                    f"Invalid JSON response from upload URL API: {e}", res.status_code
+                    f"Upload URL response missing fields: {missing_fields}"
                 )
 
+            logger.info(
+                "Successfully obtained upload URL for media ID: %s", data.get("id")
+            )
+            return data
+
+        except orjson.JSONDecodeError as e:
+            raise APIRequestError(
+                f"Invalid JSON response from upload URL API: {e}", res.status_code
+            )
+
     except httpx.HTTPStatusError as e:
         raise APIRequestError(
             f"Upload URL API request failed: {e}",
@@ -758,7 +986,7 @@ async def get_upload_url(account: HiggsfieldAccount) -> Dict[str, Any]:
     except (SessionError, TokenMintError, AuthStorageError):
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting upload URL: {e}")
+        logger.error("Unexpected error getting upload URL: %s", e)
         raise APIRequestError(f"Unexpected error getting upload URL: {e}")
 
 
@@ -779,14 +1007,14 @@ async def submit_upload(id: str, account: HiggsfieldAccount) -> None:
     try:
         token = await get_token(account)
 
-        async with httpx.AsyncClient() as client:
-            url = f"https://fnf.higgsfield.ai/media/{id}/upload"
-            headers = {"Authorization": f"Bearer {token}"}
+        client = get_http_client()
+        url = f"/media/{id}/upload"
+        headers = {"Authorization": f"Bearer {token}"}
 
-            res = await client.post(url, headers=headers, timeout=120)
-            res.raise_for_status()
+        res = await client.post(url, headers=headers)
+        _raise_for_status(res, account)
 
-            logger.info(f"Successfully submitted upload for media ID: {id}")
+        logger.info("Successfully submitted upload for media ID: %s", id)
 
     except httpx.HTTPStatusError as e:
         raise APIRequestError(
@@ -802,6 +1030,164 @@ async def submit_upload(id: str, account: HiggsfieldAccount) -> None:
         raise APIRequestError(f"Unexpected error submitting upload: {e}")
 
 
+def _peek_jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Walk JPEG segment markers up to the first SOFn frame header.
+
+    Args:
+        f: Binary file object positioned just after the SOI marker.
+
+    Returns:
+        ``(width, height)`` from the frame header, or ``None`` if the stream
+        ends or reaches the scan data before a frame header is found.
+    """
+    while True:
+        if f.read(1) != b"\xff":
+            return None
+        code = f.read(1)
+        while code == b"\xff":  # fill bytes before the marker code
+            code = f.read(1)
+        if not code:
+            return None
+        marker = code[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # standalone markers
+            continue
+        if marker == 0xDA:  # start of scan, no frame header seen
+            return None
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        (length,) = struct.unpack(">H", segment)
+        if length < 2:  # corrupt length would seek backwards forever
+            return None
+        if 0xC0 <= marker <= 0xCF and marker not in JPEG_NON_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def _peek_image_size(image_path: Path) -> Optional[Tuple[int, int]]:
+    """Read PNG, JPEG or WebP dimensions straight from the file header.
+
+    Args:
+        image_path: Path to the image file.
+
+    Returns:
+        ``(width, height)``, or ``None`` if the format is not recognised.
+    """
+    with open(image_path, "rb") as f:
+        head = f.read(32)
+        if (
+            head.startswith(b"\x89PNG\r\n\x1a\n")
+            and head[12:16] == b"IHDR"
+            and len(head) >= 24
+        ):
+            return struct.unpack(">II", head[16:24])
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+            chunk = head[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", head[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                bits = int.from_bytes(head[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return (
+                    int.from_bytes(head[24:27], "little") + 1,
+                    int.from_bytes(head[27:30], "little") + 1,
+                )
+            return None
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            return _peek_jpeg_size(f)
+    return None
+
+
+def _read_image_size(image_path: Path) -> Tuple[int, int]:
+    """Read image dimensions without decoding pixel data.
+
+    PNG, JPEG and WebP headers are parsed directly; anything else falls back
+    to Pillow, which is imported only when it is actually needed.
+    """
+    size = _peek_image_size(image_path)
+    if size is not None:
+        return size
+
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        return img.size
+
+
+async def _iter_file_chunks(path: Path) -> AsyncIterator[bytes]:
+    """Yield a file's contents in chunks without blocking the event loop."""
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+async def _post_with_retry(
+    client: httpx.AsyncClient, url: str, **kwargs: Any
+) -> httpx.Response:
+    """POST with bounded retries on connection failures and 502/503.
+
+    Only failures where the request never reached the API are retried. A read
+    timeout, dropped response or 504 counts towards the circuit breaker but is
+    raised as-is, since replaying a job submission could start a second job.
+
+    Args:
+        client: HTTP client to send the request with
+        url: Target URL
+        **kwargs: Extra arguments passed to ``client.post``
+
+    Returns:
+        The last response received (status is not checked for non-retryable codes)
+
+    Raises:
+        APIRequestError: If the circuit breaker for the host is open
+        httpx.HTTPError: If the last attempt still fails, or on a 504
+    """
+    host = client.base_url.join(url).host
+    if not _circuit_breaker.allow_request(host):
+        raise APIRequestError(
+            f"Too many recent failures talking to {host}, skipping request"
+        )
+
+    for attempt in range(SUBMIT_ATTEMPTS):
+        try:
+            res = await client.post(url, **kwargs)
+            if res.status_code in RETRYABLE_STATUS_CODES:
+                res.raise_for_status()
+        except (*RETRYABLE_ERRORS, httpx.HTTPStatusError) as e:
+            _circuit_breaker.record_failure(host)
+            if attempt == SUBMIT_ATTEMPTS - 1 or not _circuit_breaker.allow_request(
+                host
+            ):
+                raise
+            logger.warning(
+                "POST %s failed (attempt %d/%d): %s",
+                url,
+                attempt + 1,
+                SUBMIT_ATTEMPTS,
+                e,
+            )
+            await asyncio.sleep(0.2 * 2**attempt + random.random() * 0.1)
+            continue
+        except httpx.TransportError:
+            _circuit_breaker.record_failure(host)
+            raise
+        except BaseException:
+            _circuit_breaker.release(host)
+            raise
+        if res.status_code in AMBIGUOUS_STATUS_CODES:
+            _circuit_breaker.record_failure(host)
+            res.raise_for_status()
+        _circuit_breaker.record_success(host)
+        return res
+
+
 async def upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str, str]:
     """Upload an image file to Higgsfield storage.
 
@@ -813,21 +1199,47 @@ async def upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str,
         Dictionary with id, url, and type of uploaded image
 
     Raises:
-        FileUploadError: If file upload fails
+        FileUploadError: If file upload fails or exceeds ``UPLOAD_TIMEOUT``
         ValueError: If image_path is invalid
         FileNotFoundError: If image file doesn't exist
     """
+    try:
+        return await asyncio.wait_for(
+            _upload_image(image_path, account), timeout=UPLOAD_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise FileUploadError(
+            f"Image upload did not complete within {UPLOAD_TIMEOUT} seconds"
+        )
+
+
+async def _upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str, str]:
+    """Run the upload flow for ``upload_image`` without the overall deadline."""
     if not image_path or not image_path.strip():
         raise ValueError("image_path cannot be empty")
 
     image_path = Path(image_path)
-    if not image_path.exists():
+    # One stat() off the event loop instead of exists() + is_file() + stat()
+    try:
+        file_stat = await aiofiles.os.stat(image_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Image file not found: {image_path}")
 
-    if not image_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValueError(f"Path is not a file: {image_path}")
 
     try:
+        file_size = file_stat.st_size
+        if not file_size:
+            raise FileUploadError(f"Image file is empty: {image_path}")
+
+        # Read the dimensions before requesting an upload URL, so an unreadable
+        # image fails without leaving an orphaned /media record behind
+        try:
+            width, height = await asyncio.to_thread(_read_image_size, image_path)
+        except Exception as e:
+            raise FileUploadError(f"Could not read image dimensions: {e}")
+
         # Get upload URL
         upload_data = await get_upload_url(account)
         upload_url = upload_data.get("upload_url")
@@ -835,25 +1247,20 @@ async def upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str,
         url = upload_data.get("url")
         content_type = upload_data.get("content_type")
 
-        img = Image.open(image_path)
-        width, height = img.size
-
         # Upload the file
         try:
-            async with httpx.AsyncClient(timeout=120) as client:
-                with open(image_path, "rb") as f:
-                    file_content = f.read()
-
-                if not file_content:
-                    raise FileUploadError(f"Image file is empty: {image_path}")
-
-                res = await client.put(
-                    upload_url,
-                    content=file_content,
-                    headers={"Content-Type": content_type},
-                    timeout=120,
-                )
-                res.raise_for_status()
+            client = get_http_client()
+            # Stream from disk; pre-signed PUTs need an explicit Content-Length
+            res = await client.put(
+                upload_url,
+                content=_iter_file_chunks(image_path),
+                headers={
+                    "Content-Type": content_type,
+                    "Content-Length": str(file_size),
+                },
+                timeout=UPLOAD_PUT_TIMEOUT,
+            )
+            res.raise_for_status()
 
         except httpx.HTTPStatusError as e:
             raise FileUploadError(
@@ -869,7 +1276,8 @@ async def upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str,
             await submit_upload(media_id, account)
         except APIRequestError as e:
             logger.warning(
-                f"Upload completion notification failed, but image may still be uploaded: {e}"
+                "Upload completion notification failed, but image may still be uploaded: %s",
+                e,
             )
             # Don't raise here as the upload itself succeeded
 
@@ -880,7 +1288,7 @@ async def upload_image(image_path: str, account: HiggsfieldAccount) -> Dict[str,
             "width": width,
             "height": height,
         }
-        logger.info(f"Successfully uploaded image {image_path} with ID: {media_id}")
+        logger.info("Successfully uploaded image %s with ID: %s", image_path, media_id)
         return result
 
     except (FileUploadError, ValueError, FileNotFoundError):
@@ -904,7 +1312,7 @@ async def generate_video(
     Args:
         prompt: Text prompt for video generation
         image_path: Path to the input image file
-        motion: Motion preset ID
+        motion: Motion preset name (e.g. "GENERAL") or preset ID
         model: Model to use for generation
         duration: Duration of the video
         account: HiggsfieldAccount instance for authentication
@@ -919,14 +1327,9 @@ async def generate_video(
     """
 
     try:
-        # Upload the image
-        try:
-            image_data = await upload_image(image_path, account)
-        except (FileUploadError, FileNotFoundError, ValueError) as e:
-            raise VideoGenerationError(f"Image upload failed: {e}")
-
-        # Get motion configuration
-        motion_params = MOTION_ID_PARAMS.get(motion)
+        # Validate motion and duration before uploading, so a bad request costs
+        # no round trips
+        motion_params = MOTION_ID_PARAMS.get(motion) or _MOTION_BY_ID.get(motion)
         if not motion_params:
             available_motions = list(MOTION_ID_PARAMS.keys())
             raise MotionConfigError(
@@ -942,6 +1345,13 @@ async def generate_video(
         except (AttributeError, TypeError) as e:
             raise MotionConfigError(f"Invalid motion parameters structure: {e}")
 
+        # Upload the image. It mints (and caches) the account token on the way,
+        # so the job submission below reuses it without another Clerk round trip.
+        try:
+            image_data = await upload_image(image_path, account)
+        except (FileUploadError, FileNotFoundError, ValueError) as e:
+            raise VideoGenerationError(f"Image upload failed: {e}")
+
         # Build payload
         payload = {
             "params": {
@@ -965,23 +1375,32 @@ async def generate_video(
         try:
             token = await get_token(account)
 
-            async with httpx.AsyncClient(timeout=120) as client:
-                url = "https://fnf.higgsfield.ai/jobs/image2video"
-                headers = {"Authorization": f"Bearer {token}"}
+            client = get_http_client()
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
 
-                res = await client.post(url, headers=headers, json=payload)
-                res.raise_for_status()
+            res = await _post_with_retry(
+                client,
+                "/jobs/image2video",
+                headers=headers,
+                content=orjson.dumps(payload),
+                timeout=JOB_SUBMIT_TIMEOUT,
+            )
+            _raise_for_status(res, account)
 
-                try:
-                    data = res.json()
-                    logger.info(
-                        f"Successfully submitted video generation job. Job ID: {data.get('job_sets', [])}"
-                    )
-                    return data
-                except json.JSONDecodeError as e:
-                    raise VideoGenerationError(
-                        f"Invalid JSON response from video generation API: {e}"
-                    )
+            try:
+                data = orjson.loads(res.content)
+                logger.info(
+                    "Successfully submitted video generation job. Job ID: %s",
+                    data.get("job_sets", []),
+                )
+                return data
+            except orjson.JSONDecodeError as e:
+                raise VideoGenerationError(
+                    f"Invalid JSON response from video generation API: {e}"
+                )
 
         except httpx.HTTPStatusError as e:
             raise VideoGenerationError(
@@ -991,6 +1410,8 @@ async def generate_video(
             raise VideoGenerationError(
                 f"Network error during video generation request: {e}"
             )
+        except APIRequestError as e:
+            raise VideoGenerationError(f"Video generation request skipped: {e}")
 
     except (VideoGenerationError, MotionConfigError, ValueError):
         raise
@@ -1000,18 +1421,48 @@ async def generate_video(
         raise VideoGenerationError(f"Unexpected error during video generation: {e}")
 
 
-async def generate_image(
-    prompt: str,
-    model: str,
-    aspect_ratio: str,
-    guidance_scale: float,
-    seed: Optional[int],
+async def generate_videos_batch(
+    specs: List[Dict[str, str]],
     account: HiggsfieldAccount,
-    use_unlim: bool = True,
-) -> Dict[str, Any]:
-    """Generate an image from a text prompt."""
+    max_concurrency: int = 8,
+) -> List[Union[Dict[str, Any], Exception]]:
+    """Generate several videos for one account concurrently.
+
+    The account token is minted once up front and then served from the token
+    cache, and every job shares the pooled HTTP client.
+
+    Args:
+        specs: Keyword arguments for ``generate_video`` per job (prompt,
+            image_path, motion, model, duration)
+        account: HiggsfieldAccount instance for authentication
+        max_concurrency: Maximum number of jobs in flight at once
 
-    MODEL_ENDPOINTS = {
+    Returns:
+        One entry per spec, in order: the job data, or the exception that job
+        raised (a failing job does not cancel the others)
+
+    Raises:
+        VideoGenerationError: If authentication fails before any job starts
+    """
+    try:
+        await get_token(account)
+    except (SessionError, TokenMintError, AuthStorageError) as e:
+        raise VideoGenerationError(f"Authentication failed: {e}")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _generate(spec: Dict[str, str]) -> Dict[str, Any]:
+        async with semaphore:
+            return await generate_video(account=account, **spec)
+
+    return await asyncio.gather(
+        *(_generate(spec) for spec in specs), return_exceptions=True
+    )
+
+
+# Image model aliases -> job endpoint, and supported aspect ratios -> size
+MODEL_ENDPOINTS: Mapping[str, str] = MappingProxyType(
+    {
         "lite": "nano-banana-2",
         "standard": "flux-2",
         "turbo": "seedream",
@@ -1045,13 +1496,29 @@ async def generate_image(
         "game_dump": "game-dump",
         "game-dump": "game-dump",
     }
-    ASPECT_TO_DIMENSIONS: Dict[str, Tuple[int, int]] = {
+)
+
+ASPECT_TO_DIMENSIONS: Mapping[str, Tuple[int, int]] = MappingProxyType(
+    {
         "1:1": (1024, 1024),
         "3:4": (896, 1152),
         "4:3": (1152, 896),
         "16:9": (1344, 768),
         "9:16": (768, 1344),
     }
+)
+
+
+async def generate_image(
+    prompt: str,
+    model: str,
+    aspect_ratio: str,
+    guidance_scale: float,
+    seed: Optional[int],
+    account: HiggsfieldAccount,
+    use_unlim: bool = True,
+) -> Dict[str, Any]:
+    """Generate an image from a text prompt."""
 
     if not prompt or not prompt.strip():
         raise ImageGenerationError("Prompt cannot be empty")
@@ -1090,28 +1557,31 @@ async def generate_image(
     try:
         token = await get_token(account)
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            url = f"https://fnf.higgsfield.ai/jobs/{model_endpoint}"
-            headers = {"Authorization": f"Bearer {token}"}
-            res = await client.post(
-                url,
-                headers=headers,
-                json={"params": payload, "use_unlim": use_unlim},
-            )
-            res.raise_for_status()
-
-            try:
-                data = res.json()
-            except json.JSONDecodeError as e:
-                raise ImageGenerationError(
-                    f"Invalid JSON response from image generation API: {e}"
-                )
+        client = get_http_client()
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+        res = await client.post(
+            f"/jobs/{model_endpoint}",
+            headers=headers,
+            content=orjson.dumps({"params": payload, "use_unlim": use_unlim}),
+            timeout=JOB_SUBMIT_TIMEOUT,
+        )
+        _raise_for_status(res, account)
 
-            logger.info(
-                "Successfully submitted image generation job. Job ID(s): %s",
-                data.get("job_sets", []),
+        try:
+            data = orjson.loads(res.content)
+        except orjson.JSONDecodeError as e:
+            raise ImageGenerationError(
+                f"Invalid JSON response from image generation API: {e}"
             )
-            return data
+
+        logger.info(
+            "Successfully submitted image generation job. Job ID(s): %s",
+            data.get("job_sets", []),
+        )
+        return data
 
     except httpx.HTTPStatusError as e:
         raise ImageGenerationError(
@@ -1125,17 +1595,37 @@ async def generate_image(
         raise ImageGenerationError(f"Unexpected error during image generation: {e}")
 
 
-def _refresh_account_auth_sync(cookies_json: list, account_id: int) -> list:
+# Playwright's sync API is bound to the thread that started it, so every refresh
+# runs on one dedicated worker thread that keeps the driver and a headless Chromium
+# alive between calls; each refresh only opens (and closes) its own context.
+_playwright_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="playwright"
+)
+_playwright = None
+_browser = None
+
+
+def _get_playwright():
+    """Start the Playwright driver on first use and reuse it afterwards.
+
+    Must only be called from ``_playwright_executor``'s worker thread.
     """
-    Synchronous helper to refresh account auth using Playwright.
-    
-    This runs in a thread pool to avoid blocking the async event loop.
-    Returns the new cookies list.
+    global _playwright
+    if _playwright is None:
+        from playwright.sync_api import sync_playwright
+
+        _playwright = sync_playwright().start()
+    return _playwright
+
+
+def _get_browser():
+    """Launch headless Chromium on first use, or again if it has gone away.
+
+    Must only be called from ``_playwright_executor``'s worker thread.
     """
-    from playwright.sync_api import sync_playwright
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
+    global _browser
+    if _browser is None or not _browser.is_connected():
+        _browser = _get_playwright().chromium.launch(
             headless=True,
             args=[
                 "--disable-blink-features=AutomationControlled",
@@ -1146,92 +1636,167 @@ def _refresh_account_auth_sync(cookies_json: list, account_id: int) -> list:
                 "--use-mock-keychain",
             ],
         )
+    return _browser
 
-        # Load existing cookies into context
-        context = browser.new_context(
-            storage_state={"cookies": cookies_json}
-        )
+
+def _close_playwright_sync() -> None:
+    """Close the shared browser and stop the driver, on the Playwright thread."""
+    global _browser, _playwright
+    try:
+        if _browser is not None:
+            _browser.close()
+    finally:
+        _browser = None
+        if _playwright is not None:
+            _playwright.stop()
+            _playwright = None
+
+
+async def close_playwright() -> None:
+    """Shut down the shared browser; called on application shutdown."""
+    if _playwright is None:
+        return
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_playwright_executor, _close_playwright_sync)
+
+
+def _refresh_account_auth_sync(cookies_json: list, account_id: int) -> list:
+    """
+    Synchronous helper to refresh account auth using Playwright.
+
+    This runs on the Playwright worker thread to avoid blocking the async event loop.
+    Returns the new cookies list.
+    """
+    # Load existing cookies into a fresh context on the shared browser
+    context = _get_browser().new_context(storage_state={"cookies": cookies_json})
+
+    try:
         page = context.new_page()
 
         logger.info("Opening Higgsfield with saved cookies...")
         page.goto("https://higgsfield.ai/create/video")
 
         current_url = page.url
-        logger.info(f"Current URL: {current_url}")
+        logger.info("Current URL: %s", current_url)
 
-        if "auth" in current_url:
+        if urlsplit(current_url).path.startswith("/auth"):
             logger.warning("Still on auth page — session might be expired.")
         else:
             logger.info("Session restored successfully, user is logged in.")
 
-        # Save the refreshed storage state
-        temp_path = Path(f"{account_id}.json")
-        page.context.storage_state(path=str(temp_path))
-        logger.info(f"Saved refreshed auth state to {temp_path}")
-
-        browser.close()
-        
-        new_auth = json.loads(temp_path.read_text())
-        new_cookies = [
-            c
-            for c in new_auth.get("cookies", [])
-            if "higgsfield.ai" in c.get("domain", "")
-        ]
-        temp_path.unlink()
-        
+        # Grab the refreshed storage state directly instead of via a temp file
+        new_auth = context.storage_state()
+        logger.info("Captured refreshed auth state for account %s", account_id)
+    finally:
+        context.close()
+
+    new_cookies = [
+        c for c in new_auth.get("cookies", []) if is_hf_domain(c.get("domain", ""))
+    ]
+
+    return new_cookies
+
+
+async def _refresh_account_auth(account: HiggsfieldAccount) -> list:
+    """Run the Playwright refresh for ``account`` and persist the new cookies."""
+    loop = asyncio.get_running_loop()
+    new_cookies = await loop.run_in_executor(
+        _playwright_executor,
+        _refresh_account_auth_sync,
+        account.cookies_json,
+        account.id,
+    )
+
+    now = datetime.now(timezone.utc)
+    if new_cookies == account.cookies_json:
+        # Nothing rotated; bump the timestamp without rewriting the whole row
+        await HiggsfieldAccount.filter(id=account.id).update(last_updated_at=now)
+        account.last_updated_at = now
+        logger.info("Auth state unchanged for account %s", account.id)
         return new_cookies
 
+    account.cookies_json = new_cookies
+    account.last_updated_at = now
+    # Write only what changed, so stale in-memory fields (e.g. balance) from a
+    # long-running refresh can't clobber concurrent updates
+    await account.save(update_fields=["cookies_json", "last_updated_at"])
+    invalidate_token(account.id)
+    _parse_jwt_payload.cache_clear()
+
+    logger.info("Saved refreshed auth state for account %s", account.id)
+    return new_cookies
+
+
+# In-flight refreshes keyed by account id, so concurrent callers share one browser run
+_refresh_inflight: Dict[int, "asyncio.Future[list]"] = {}
+
 
 async def refresh_account_auth(account: HiggsfieldAccount):
-    """Load saved session cookies, visit Higgsfield, and save refreshed storage state."""
-    import asyncio
-    import concurrent.futures
+    """Load saved session cookies, visit Higgsfield, and save refreshed storage state.
 
+    Concurrent calls for the same account are coalesced into a single refresh.
+    """
     if not account.cookies_json:
         logger.error("No cookies provided for account %s", account.id)
         raise ValueError("No cookies provided")
 
-    # Run sync Playwright in a thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        new_cookies = await loop.run_in_executor(
-            pool,
-            _refresh_account_auth_sync,
-            account.cookies_json,
-            account.id,
-        )
+    refresh = _refresh_inflight.get(account.id)
+    if refresh is None:
+        refresh = asyncio.ensure_future(_refresh_account_auth(account))
+        _refresh_inflight[account.id] = refresh
+        refresh.add_done_callback(lambda _: _refresh_inflight.pop(account.id, None))
+    else:
+        logger.info("Auth refresh already running for account %s, waiting", account.id)
+
+    # Shield so a cancelled caller doesn't abort the refresh others are waiting on
+    account.cookies_json = await asyncio.shield(refresh)
 
-    account.cookies_json = new_cookies
-    account.last_updated_at = datetime.now(timezone.utc)
-    await account.save()
 
-    logger.info(f"Saved refreshed auth state for account {account.id}")
+# Raw /user bodies per account id: (body, unix time after which it is stale).
+# Bodies are decoded per call so callers never share (or mutate) one dict.
+_user_info_cache: Dict[int, Tuple[bytes, float]] = {}
+USER_INFO_TTL = 30
 
 
-async def get_account_info(account: HiggsfieldAccount):
-    """Get the balance of an account."""
+async def get_account_info(account: HiggsfieldAccount, force: bool = False):
+    """Get the balance of an account.
+
+    Responses are cached per account for ``USER_INFO_TTL`` seconds; pass
+    ``force=True`` to bypass the cache, e.g. right after spending credits.
+    Each call returns a freshly decoded dict, and a failed request drops the
+    cached entry instead of leaving stale data behind.
+    """
+    cached = _user_info_cache.get(account.id)
+    if not force and cached and time.time() < cached[1]:
+        return orjson.loads(cached[0])
+
     try:
         token = await get_token(account)
-        async with httpx.AsyncClient(timeout=120) as client:
-            url = "https://fnf.higgsfield.ai/user"
-            headers = {"Authorization": f"Bearer {token}"}
-            res = await client.get(url, headers=headers)
-            res.raise_for_status()
-            return res.json()
+        client = get_http_client()
+        headers = {"Authorization": f"Bearer {token}"}
+        res = await client.get("/user", headers=headers)
+        _raise_for_status(res, account)
+        data = orjson.loads(res.content)
+        _user_info_cache[account.id] = (res.content, time.time() + USER_INFO_TTL)
+        return data
     except Exception as e:
-        logger.error(f"Error getting account info: {e}")
+        _user_info_cache.pop(account.id, None)
+        logger.error("Error getting account info: %s", e)
         raise APIRequestError(f"Error getting account info: {e}")
 
 
 async def get_last_used_account():
     """Get the last used account."""
-    accounts = await HiggsfieldAccount.filter(is_active=True).order_by("last_used_at")
-    if not accounts:
+    account = (
+        await HiggsfieldAccount.filter(is_active=True).order_by("last_used_at").first()
+    )
+    if account is None:
         return None
-    for account in accounts:
-        account.last_used_at = datetime.now(timezone.utc)
-        await account.save()
-        return account
+    account.last_used_at = datetime.now(timezone.utc)
+    await HiggsfieldAccount.filter(id=account.id).update(
+        last_used_at=account.last_used_at
+    )
+    return account
 
 
 async def ensure_authenticated_account():
@@ -1277,11 +1842,13 @@ async def ensure_authenticated_account():
     
     # Load cookies from auth.json
     try:
-        auth_data = json.loads(auth_json_path.read_text(encoding="utf-8"))
-        cookies = auth_data.get("cookies", [])
-        
-        # Filter to Higgsfield cookies only
-        hf_cookies = [c for c in cookies if "higgsfield.ai" in c.get("domain", "")]
+        # Fresh dicts: the model must not hold (or mutate) the cached cookies
+        hf_cookies = [
+            dict(c)
+            for c in load_hf_cookies(
+                str(auth_json_path), auth_json_path.stat().st_mtime_ns
+            )
+        ]
         
         if not hf_cookies:
             raise RuntimeError(
@@ -1289,7 +1856,7 @@ async def ensure_authenticated_account():
                 "Please run 'python scripts/manage_accounts.py login --force' to re-authenticate."
             )
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise RuntimeError(f"Invalid auth.json format: {e}")
     
     # Get username from .env.credentials
@@ -1310,7 +1877,9 @@ async def ensure_authenticated_account():
         existing_account.cookies_json = hf_cookies
         existing_account.is_active = True
         existing_account.last_updated_at = datetime.now(timezone.utc)
-        await existing_account.save()
+        await existing_account.save(
+            update_fields=["cookies_json", "is_active", "last_updated_at"]
+        )
         logger.info("Updated existing account: %s", username)
         account = existing_account
     else:
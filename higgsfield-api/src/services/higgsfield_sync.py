@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 import base64
-import json
 import logging
 import sys
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import APP_ORIGIN, CLERK_APIVER, CLERK_BASE, CLERK_JSVER, STORAGE
+from src.utils.cookies import (
+    find_cookie,
+    hf_cookie_entries,
+    index_cookies,
+    load_hf_cookies,
+)
 
 logger = logging.getLogger("higgsfield")
 
@@ -23,18 +31,58 @@ FRAME_MAPPING = {
     "5": 81,
 }
 
+_CLERK_PARAMS = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
+_CLERK_JSON_HEADERS = {
+    "Accept": "application/json",
+    "Origin": APP_ORIGIN,
+    "Referer": f"{APP_ORIGIN}/",
+}
+_CLERK_FORM_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "*/*",
+    "Origin": APP_ORIGIN,
+    "Referer": f"{APP_ORIGIN}/",
+}
+
+
+def _new_session() -> requests.Session:
+    sess = requests.Session()
+    # Pooled keep-alive connections; only idempotent GETs are retried, so job
+    # submissions and streamed uploads are never sent twice
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+    )
+    sess.mount(
+        "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    )
+    return sess
+
+
+# fnf.higgsfield.ai API calls; the bearer token is passed per request
+_session = _new_session()
+# Clerk calls carry the auth.json cookies, so they get their own session
+_clerk_session = _new_session()
+# Optional: look a bit more like a browser
+_clerk_session.headers.update(
+    {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/141.0"}
+)
+
 
 def load_cookiejar(storage_path: Path) -> requests.cookies.RequestsCookieJar:
-    if not storage_path.exists():
+    try:
+        mtime_ns = storage_path.stat().st_mtime_ns
+    except FileNotFoundError:
         sys.stderr.write(f"[!] auth.json not found at {storage_path}\n")
         sys.exit(1)
-    state = json.loads(storage_path.read_text(encoding="utf-8"))
+    # Shared with the async service: cached per mtime, malformed cookies skipped
+    cookies = load_hf_cookies(str(storage_path), mtime_ns)
     jar = requests.cookies.RequestsCookieJar()
-    for c in state.get("cookies", []):
-        # Keep all cookies for higgsfield.ai and clerk.higgsfield.ai (and subdomains)
-        dom = c.get("domain", "")
-        if "higgsfield.ai" in dom:
-            jar.set(c["name"], c["value"], domain=dom, path=c.get("path", "/"))
+    for name, value, dom, path in hf_cookie_entries(map(dict, cookies)):
+        jar.set(name, value, domain=dom, path=path)
+    index_cookies(jar, jar)
     return jar
 
 
@@ -43,10 +91,7 @@ def get_cookie(
     name: str,
     domain_contains: str | None = None,
 ) -> str | None:
-    for c in jar:
-        if c.name == name and (domain_contains is None or domain_contains in c.domain):
-            return c.value
-    return None
+    return find_cookie(jar, jar, name, domain_contains)
 
 
 def b64url_decode(s: str) -> bytes:
@@ -73,7 +118,7 @@ def try_session_id_from___session_jwt(jar) -> str | None:
             parts = tok.split(".")
             if len(parts) < 2:
                 continue
-            payload = json.loads(b64url_decode(parts[1]).decode("utf-8"))
+            payload = orjson.loads(b64url_decode(parts[1]))
             sid = payload.get("sid")
             if isinstance(sid, str) and sid.startswith("sess_"):
                 return sid
@@ -85,15 +130,9 @@ def try_session_id_from___session_jwt(jar) -> str | None:
 def get_session_id_via_api(sess: requests.Session) -> str | None:
     # Fallback: GET /v1/client and pick last_active_session_id or an active session
     url = f"{CLERK_BASE}/v1/client"
-    params = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
-    headers = {
-        "Accept": "application/json",
-        "Origin": APP_ORIGIN,
-        "Referer": f"{APP_ORIGIN}/",
-    }
-    r = sess.get(url, params=params, headers=headers, timeout=20)
+    r = sess.get(url, params=_CLERK_PARAMS, headers=_CLERK_JSON_HEADERS, timeout=20)
     r.raise_for_status()
-    j = r.json()
+    j = orjson.loads(r.content)
     client = j.get("client", j)
     sid = client.get("last_active_session_id")
     if sid:
@@ -108,17 +147,10 @@ def get_session_id_via_api(sess: requests.Session) -> str | None:
 
 def mint_session_token(sess: requests.Session, session_id: str) -> str:
     url = f"{CLERK_BASE}/v1/client/sessions/{session_id}/tokens"
-    params = {"__clerk_api_version": CLERK_APIVER, "_clerk_js_version": CLERK_JSVER}
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Accept": "*/*",
-        "Origin": APP_ORIGIN,
-        "Referer": f"{APP_ORIGIN}/",
-    }
     # Try without any form data - Clerk API doesn't accept action parameter
-    r = sess.post(url, params=params, headers=headers, timeout=20)
+    r = sess.post(url, params=_CLERK_PARAMS, headers=_CLERK_FORM_HEADERS, timeout=20)
     r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
     for key in ("jwt", "token", "client_jwt", "session_token"):
         if key in data and isinstance(data[key], str) and data[key]:
             return data[key]
@@ -127,12 +159,11 @@ def mint_session_token(sess: requests.Session, session_id: str) -> str:
 
 def get_token():
     jar = load_cookiejar(Path(STORAGE))
-    sess = requests.Session()
+    sess = _clerk_session
+    # Replace rather than merge, so cookies from an earlier auth.json (or another
+    # account) are never sent to Clerk
+    sess.cookies.clear()
     sess.cookies.update(jar)
-    # Optional: look a bit more like a browser
-    sess.headers.update(
-        {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/141.0"}
-    )
 
     # 1) Fast path: cookie value
     sid = try_session_id_from_clerk_active_context(jar)
@@ -166,33 +197,33 @@ def get_token():
 
 def get_job_set_id(job_set_id: str):
     token = get_token()
-    res = requests.get(
+    res = _session.get(
         f"https://fnf.higgsfield.ai/job-sets/{job_set_id}",
         headers={"Authorization": f"Bearer {token}"},
     )
-    return res.json()
+    return orjson.loads(res.content)
 
 
 def get_motions(size: int = 30, preset_family: str = "higgsfield"):
     token = get_token()
-    res = requests.get(
+    res = _session.get(
         f"https://fnf.higgsfield.ai/motions?size={size}&search=&preset_family={preset_family}",
         headers={"Authorization": f"Bearer {token}"},
     )
-    return res.json()
+    return orjson.loads(res.content)
 
 
 def get_upload_url():
     token = get_token()
-    res = requests.post(
+    res = _session.post(
         "https://fnf.higgsfield.ai/media", headers={"Authorization": f"Bearer {token}"}
     )
-    return res.json()
+    return orjson.loads(res.content)
 
 
 def submit_upload(id: str):
     token = get_token()
-    requests.post(
+    _session.post(
         f"https://fnf.higgsfield.ai/media/{id}/upload",
         headers={"Authorization": f"Bearer {token}"},
     )
@@ -205,7 +236,7 @@ def upload_image(image_path: str):
     url = upload_data.get("url")
     content_type = upload_data.get("content_type")
     with open(image_path, "rb") as f:
-        requests.put(
+        _session.put(
             upload_url,
             data=f,
             headers={"Content-Type": content_type},
@@ -253,9 +284,12 @@ def generate_video(
     }
 
     token = get_token()
-    res = requests.post(
+    res = _session.post(
         "https://fnf.higgsfield.ai/jobs/image2video",
-        headers={"Authorization": f"Bearer {token}"},
-        json=payload,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+        data=orjson.dumps(payload),
     )
-    return res.json()
+    return orjson.loads(res.content)
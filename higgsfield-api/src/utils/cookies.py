@@ -0,0 +1,135 @@
+import functools
+import logging
+import weakref
+from http.cookiejar import Cookie
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger("higgsfield")
+
+# A stored cookie as (key, value) pairs, e.g. (("name", "__session"), ...)
+CookieItems = Tuple[Tuple[str, Any], ...]
+# (name, value, domain, path), ready to be set on a cookie jar
+CookieEntry = Tuple[str, str, str, str]
+
+
+def is_hf_domain(domain: str) -> bool:
+    """
+    Return True for higgsfield.ai and its subdomains (e.g. clerk.higgsfield.ai).
+
+    :param domain: Cookie domain.
+    :type domain: str
+
+    :rtype: bool
+    """
+    return domain.endswith(".higgsfield.ai") or domain == "higgsfield.ai"
+
+
+@functools.lru_cache(maxsize=4)
+def load_hf_cookies(path_str: str, mtime_ns: int) -> Tuple[CookieItems, ...]:
+    """
+    Parse an auth.json file and keep only its Higgsfield cookies.
+
+    Cached on ``(path, mtime)`` so an unchanged file is decoded once, while a
+    rewritten one is picked up on the next call. Cookies are returned as
+    immutable item tuples so callers cannot alter the cached copy; use
+    ``dict(cookie)`` to get a mutable one.
+
+    :param path_str: Path to the auth.json file.
+    :type path_str: str
+    :param mtime_ns: The file's ``st_mtime_ns``, used only as part of the cache key.
+    :type mtime_ns: int
+
+    :raises orjson.JSONDecodeError: If the file is not valid JSON.
+
+    :return: Cookies for higgsfield.ai and its subdomains.
+    :rtype: Tuple[CookieItems, ...]
+    """
+    auth_data = orjson.loads(Path(path_str).read_bytes())
+    return tuple(
+        tuple(c.items())
+        for c in auth_data.get("cookies", [])
+        if isinstance(c, dict) and is_hf_domain(c.get("domain", ""))
+    )
+
+
+def hf_cookie_entries(cookies: Iterable[Mapping[str, Any]]) -> List[CookieEntry]:
+    """
+    Validate stored cookies and keep the Higgsfield ones.
+
+    :param cookies: Cookie dicts as saved in auth.json or ``cookies_json``.
+    :type cookies: Iterable[Mapping[str, Any]]
+
+    :return: ``(name, value, domain, path)`` tuples for higgsfield.ai and its
+        subdomains; malformed entries are logged and skipped.
+    :rtype: List[CookieEntry]
+    """
+    entries = []
+    for c in cookies:
+        try:
+            dom = c.get("domain", "")
+            if is_hf_domain(dom):
+                entries.append((c["name"], c["value"], dom, c.get("path", "/")))
+        except (AttributeError, KeyError, TypeError) as e:
+            name = c.get("name", "unknown") if isinstance(c, Mapping) else "unknown"
+            logger.warning("Skipping malformed cookie %s: %s", name, e)
+    return entries
+
+
+# name -> [(domain, value), ...] for indexed jars, keyed by id(jar). httpx.Cookies
+# is unhashable, so entries are dropped by a finalizer instead of a
+# WeakKeyDictionary. Indexed jars are treated as read-only.
+_cookie_indexes: Dict[int, Dict[str, List[Tuple[str, str]]]] = {}
+
+
+def index_cookies(jar: object, cookies: Iterable[Cookie]) -> None:
+    """
+    Index a freshly built jar by cookie name for ``find_cookie``.
+
+    :param jar: The jar object callers will look cookies up on.
+    :type jar: object
+    :param cookies: The jar's ``http.cookiejar`` cookies.
+    :type cookies: Iterable[Cookie]
+    """
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for c in cookies:
+        index.setdefault(c.name, []).append((c.domain, c.value))
+
+    key = id(jar)
+    _cookie_indexes[key] = index
+    weakref.finalize(jar, _cookie_indexes.pop, key, None)
+
+
+def find_cookie(
+    jar: object,
+    cookies: Iterable[Cookie],
+    name: str,
+    domain_contains: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Look up a cookie value, using the jar's index when it has one.
+
+    :param jar: Jar passed to ``index_cookies``, if it was indexed.
+    :type jar: object
+    :param cookies: The jar's cookies, scanned when there is no index.
+    :type cookies: Iterable[Cookie]
+    :param name: Cookie name to search for.
+    :type name: str
+    :param domain_contains: (optional) Substring the cookie domain must contain.
+    :type domain_contains: str, optional
+
+    :return: The first matching cookie value, or None.
+    :rtype: Optional[str]
+    """
+    index = _cookie_indexes.get(id(jar))
+    if index is None:
+        candidates = ((c.domain, c.value) for c in cookies if c.name == name)
+    else:
+        candidates = index.get(name, ())
+
+    for domain, value in candidates:
+        if domain_contains is None or domain_contains in domain:
+            return value
+    return None
@@ -1,8 +1,11 @@
+import atexit
 import logging
 import os
+import queue
 import time
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Optional
 
 
 class DailyFileHandler(TimedRotatingFileHandler):
@@ -42,7 +45,12 @@ class DailyFileHandler(TimedRotatingFileHandler):
         self.rolloverAt = self.computeRollover(currentTime)
 
 
+# Owns the real file/console handlers on a background thread
+_listener: Optional[QueueListener] = None
+
+
 def setup_logger() -> logging.Logger:
+    global _listener
     logger = logging.getLogger("higgsfield")
     # allow override via environment
     logger.setLevel(os.getenv("HIGGSFIELD_LOG_LEVEL", "INFO").upper())
@@ -53,12 +61,20 @@ def setup_logger() -> logging.Logger:
         handler = DailyFileHandler(log_dir=log_dir, backupCount=14)
         formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
 
         # (Optional) also log to console
         console = logging.StreamHandler()
         console.setFormatter(formatter)
-        logger.addHandler(console)
+
+        # Callers (including the event loop) only enqueue records; the listener
+        # thread does the file and console writes, rollover included
+        log_queue: queue.Queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(
+            log_queue, handler, console, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
 
     return logger
 
@@ -1,8 +1,117 @@
-import hashlib
+import functools
 import hmac
+import mmap
+import os
+from typing import Iterable, List, Union
 
+# All digests go through hmac.digest() with the algorithm *name*, which CPython
+# hands to OpenSSL's one-shot HMAC. OpenSSL picks SHA-NI / ARMv8 SHA2 code paths
+# from CPUID on its own; on VMs that mask those flags, operators can override the
+# detection with the OPENSSL_ia32cap environment variable.
 
-def create_hmac_sha256_signature(key: str, data: str, message: str = "MusicAPI") -> str:
+
+@functools.lru_cache(maxsize=32)
+def derive_signing_key(key: str, message: str, legacy_hex_key: bool = True) -> bytes:
+    """
+    Derive the second-stage signing key from ``key`` and ``message``.
+
+    The secret and derivation message are fixed for the life of the process,
+    so the derived key is cached instead of being recomputed per signature.
+
+    :param key: Secret key used to generate the signature.
+    :type key: str
+    :param message: Prefix message used to derive the key.
+    :type message: str
+    :param legacy_hex_key: (optional) Use the hex digest as the key, as existing
+        receivers expect. ``False`` uses the raw 32-byte digest instead, which
+        produces different signatures and must be supported by the verifier.
+    :type legacy_hex_key: bool, optional
+
+    :return: First HMAC stage digest, hex-encoded as ASCII bytes or raw.
+    :rtype: bytes
+    """
+    digest = hmac.digest(key.encode(), message.encode(), "sha256")
+    return digest.hex().encode() if legacy_hex_key else digest
+
+
+def create_hmac_sha256_signature_precomputed(derived_key: bytes, data: str) -> str:
+    """
+    Sign ``data`` with a key already returned by ``derive_signing_key``.
+
+    :param derived_key: Derived signing key.
+    :type derived_key: bytes
+    :param data: The message or payload to sign.
+    :type data: str
+
+    :return: Hex-encoded SHA-256 signature.
+    :rtype: str
+    """
+    return hmac.digest(derived_key, data.encode(), "sha256").hex()
+
+
+def create_hmac_sha256_signatures_batch(
+    derived_key: bytes, payloads: Iterable[str]
+) -> List[str]:
+    """
+    Sign several payloads with the same pre-derived key.
+
+    :param derived_key: Signing key returned by ``derive_signing_key``.
+    :type derived_key: bytes
+    :param payloads: Messages or payloads to sign.
+    :type payloads: Iterable[str]
+
+    :return: Hex-encoded SHA-256 signatures, in the order of ``payloads``.
+    :rtype: List[str]
+    """
+    digest = hmac.digest
+    return [digest(derived_key, data.encode(), "sha256").hex() for data in payloads]
+
+
+def create_hmac_sha256_signature_stream(
+    derived_key: bytes, chunks: Iterable[bytes]
+) -> str:
+    """
+    Sign a payload delivered in chunks without joining it into one buffer.
+
+    :param derived_key: Signing key returned by ``derive_signing_key``.
+    :type derived_key: bytes
+    :param chunks: Consecutive pieces of the payload, in order.
+    :type chunks: Iterable[bytes]
+
+    :return: Hex-encoded SHA-256 signature of the concatenated chunks.
+    :rtype: str
+    """
+    signer = hmac.new(derived_key, digestmod="sha256")
+    for chunk in chunks:
+        signer.update(chunk)
+    return signer.hexdigest()
+
+
+def create_hmac_sha256_signature_file(
+    derived_key: bytes, path: Union[str, os.PathLike]
+) -> str:
+    """
+    Sign the contents of a file, letting the OS page cache stream it.
+
+    :param derived_key: Signing key returned by ``derive_signing_key``.
+    :type derived_key: bytes
+    :param path: Path of the file to sign.
+    :type path: Union[str, os.PathLike]
+
+    :return: Hex-encoded SHA-256 signature of the file contents.
+    :rtype: str
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # mmap refuses zero-length files
+            return create_hmac_sha256_signature_stream(derived_key, ())
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return create_hmac_sha256_signature_stream(derived_key, (mapped,))
+
+
+def create_hmac_sha256_signature(
+    key: str, data: str, message: str = "MusicAPI", legacy_hex_key: bool = True
+) -> str:
     """
     Create an HMAC SHA-256 signature for given data using a key and an optional message.
 
@@ -15,9 +124,15 @@ def create_hmac_sha256_signature(key: str, data: str, message: str = "MusicAPI")
     :type data: str
     :param message: (optional) A prefix message used to further derive the key.
     :type message: str, optional
+    :param legacy_hex_key: (optional) Sign with the hex-encoded intermediate key
+        (the default, compatible with existing receivers) rather than raw bytes.
+    :type legacy_hex_key: bool, optional
 
     :return: Hex-encoded SHA-256 signature.
     :rtype: str
     """
-    key = hmac.new(key.encode(), message.encode(), hashlib.sha256).hexdigest()
-    return hmac.new(key.encode(), data.encode(), hashlib.sha256).hexdigest()
+    # hmac.digest() with a named algorithm takes OpenSSL's one-shot C path
+    # instead of building an HMAC object per stage; the first stage is cached.
+    return create_hmac_sha256_signature_precomputed(
+        derive_signing_key(key, message, legacy_hex_key), data
+    )
@@ -0,0 +1,32 @@
+"""Shared fixtures for the Higgsfield API test suite."""
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from tortoise import Tortoise
+
+from src.main import app
+from src.repository.db_config import TORTOISE_ORM
+from src.services.higgsfield import close_http_client
+
+# Same models as the app, but never the on-disk database
+TEST_TORTOISE_ORM = {**TORTOISE_ORM, "connections": {"default": "sqlite://:memory:"}}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """One in-process ASGI client for the whole session.
+
+    The app lifespan is deliberately not entered: it would open the real SQLite
+    file, rewrite task statuses and start the scheduler, which submits queued
+    tasks to Higgsfield and posts webhooks. Tests get an in-memory database.
+    """
+    await Tortoise.init(config=TEST_TORTOISE_ORM)
+    await Tortoise.generate_schemas()
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as test_client:
+            yield test_client
+    finally:
+        await close_http_client()
+        await Tortoise.close_connections()
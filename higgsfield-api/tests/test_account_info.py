@@ -0,0 +1,71 @@
+"""Tests for the short-lived /user response cache."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.services import higgsfield
+from src.utils.exceptions import APIRequestError
+
+
+@pytest.fixture
+async def user_api(monkeypatch):
+    """Serve /user from a mock transport and let tests drive the clock."""
+    state = SimpleNamespace(calls=0, status=200, now=1000.0)
+
+    def handler(request):
+        state.calls += 1
+        return httpx.Response(
+            state.status, json={"subscription_credits": state.calls}, request=request
+        )
+
+    async def fake_get_token(account):
+        return "token"
+
+    async with httpx.AsyncClient(
+        base_url="http://test", transport=httpx.MockTransport(handler)
+    ) as client:
+        monkeypatch.setattr(higgsfield, "get_http_client", lambda: client)
+        monkeypatch.setattr(higgsfield, "get_token", fake_get_token)
+        monkeypatch.setattr(higgsfield.time, "time", lambda: state.now)
+        monkeypatch.setattr(higgsfield, "_user_info_cache", {})
+        yield state
+
+
+async def test_cached_within_ttl_and_refetched_after(user_api):
+    """A second call within the TTL is served from the cache as a fresh copy."""
+    account = SimpleNamespace(id=1)
+
+    first = await higgsfield.get_account_info(account)
+    first["subscription_credits"] = -1
+    assert await higgsfield.get_account_info(account) == {"subscription_credits": 1}
+    assert user_api.calls == 1
+
+    user_api.now += higgsfield.USER_INFO_TTL
+    assert await higgsfield.get_account_info(account) == {"subscription_credits": 2}
+
+
+async def test_force_bypasses_cache(user_api):
+    """force=True always hits /user and refreshes the cached entry."""
+    account = SimpleNamespace(id=1)
+
+    await higgsfield.get_account_info(account)
+    assert await higgsfield.get_account_info(account, force=True) == {
+        "subscription_credits": 2
+    }
+    assert await higgsfield.get_account_info(account) == {"subscription_credits": 2}
+    assert user_api.calls == 2
+
+
+async def test_failed_request_drops_cached_entry(user_api):
+    """A failed refresh evicts the old entry rather than serving it later."""
+    account = SimpleNamespace(id=1)
+
+    await higgsfield.get_account_info(account)
+    user_api.status = 500
+    with pytest.raises(APIRequestError):
+        await higgsfield.get_account_info(account, force=True)
+
+    user_api.status = 200
+    assert await higgsfield.get_account_info(account) == {"subscription_credits": 3}
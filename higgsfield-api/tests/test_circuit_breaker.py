@@ -0,0 +1,81 @@
+"""Tests for job submission retries and the per-host circuit breaker."""
+
+import httpx
+import pytest
+
+from src.services import higgsfield
+from src.services.higgsfield import _CircuitBreaker, _post_with_retry
+
+
+def test_half_open_lets_a_single_probe_through(monkeypatch):
+    """After the cooldown only one caller probes until its result is recorded."""
+    now = [0.0]
+    monkeypatch.setattr(higgsfield.time, "monotonic", lambda: now[0])
+    breaker = _CircuitBreaker(threshold=1, window=30.0, cooldown=10.0)
+
+    breaker.record_failure("api")
+    assert not breaker.allow_request("api")
+
+    now[0] = 11.0
+    assert breaker.allow_request("api")
+    assert not breaker.allow_request("api")
+
+    breaker.record_success("api")
+    assert breaker.allow_request("api")
+
+
+def test_released_probe_hands_over_to_next_caller(monkeypatch):
+    """A probe that ends without a result lets the next caller probe instead."""
+    now = [0.0]
+    monkeypatch.setattr(higgsfield.time, "monotonic", lambda: now[0])
+    breaker = _CircuitBreaker(threshold=1, window=30.0, cooldown=10.0)
+
+    breaker.record_failure("api")
+    now[0] = 11.0
+    assert breaker.allow_request("api")
+    breaker.release("api")
+    assert breaker.allow_request("api")
+    assert not breaker.allow_request("api")
+
+
+@pytest.mark.parametrize(
+    "error, attempts",
+    [(httpx.ConnectError, higgsfield.SUBMIT_ATTEMPTS), (httpx.ReadTimeout, 1)],
+)
+async def test_only_unsent_requests_are_retried(monkeypatch, error, attempts):
+    """Connection failures are retried; a read timeout is never replayed."""
+    monkeypatch.setattr(higgsfield, "_circuit_breaker", _CircuitBreaker())
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise error("boom", request=request)
+
+    async with httpx.AsyncClient(
+        base_url="http://test", transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(error):
+            await _post_with_retry(client, "/jobs/image2video")
+
+    assert len(calls) == attempts
+
+
+@pytest.mark.parametrize(
+    "status, attempts", [(503, higgsfield.SUBMIT_ATTEMPTS), (504, 1)]
+)
+async def test_gateway_timeout_is_not_retried(monkeypatch, status, attempts):
+    """A 503 is retried; a 504 may have reached the API and is raised at once."""
+    monkeypatch.setattr(higgsfield, "_circuit_breaker", _CircuitBreaker())
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(status, request=request)
+
+    async with httpx.AsyncClient(
+        base_url="http://test", transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await _post_with_retry(client, "/jobs/image2video")
+
+    assert len(calls) == attempts
@@ -0,0 +1,83 @@
+"""Tests for the shared auth.json cookie helpers."""
+
+from http.cookiejar import Cookie, CookieJar
+
+import orjson
+
+from src.utils.cookies import (
+    find_cookie,
+    hf_cookie_entries,
+    index_cookies,
+    load_hf_cookies,
+)
+
+AUTH_STATE = {
+    "cookies": [
+        {"name": "__session", "value": "jwt", "domain": ".higgsfield.ai"},
+        {"name": "__client", "value": "c", "domain": "clerk.higgsfield.ai"},
+        {"name": "other", "value": "x", "domain": "example.com"},
+        {"value": "nameless", "domain": "higgsfield.ai"},
+    ]
+}
+
+
+def _write_auth(tmp_path):
+    path = tmp_path / "auth.json"
+    path.write_bytes(orjson.dumps(AUTH_STATE))
+    return path
+
+
+def test_load_hf_cookies_is_immutable_and_filtered(tmp_path):
+    """Only Higgsfield cookies are kept, as tuples callers copy with dict()."""
+    path = _write_auth(tmp_path)
+    cookies = load_hf_cookies(str(path), path.stat().st_mtime_ns)
+
+    assert all(isinstance(c, tuple) for c in cookies)
+    assert [dict(c).get("name") for c in cookies] == ["__session", "__client", None]
+    assert load_hf_cookies(str(path), path.stat().st_mtime_ns) is cookies
+
+
+def test_malformed_cookies_are_skipped(tmp_path):
+    """A cookie without a name is dropped instead of raising KeyError."""
+    path = _write_auth(tmp_path)
+    cookies = load_hf_cookies(str(path), path.stat().st_mtime_ns)
+
+    assert hf_cookie_entries(map(dict, cookies)) == [
+        ("__session", "jwt", ".higgsfield.ai", "/"),
+        ("__client", "c", "clerk.higgsfield.ai", "/"),
+    ]
+
+
+def _cookie(name: str, value: str, domain: str) -> Cookie:
+    return Cookie(
+        version=0,
+        name=name,
+        value=value,
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=True,
+        domain_initial_dot=False,
+        path="/",
+        path_specified=True,
+        secure=False,
+        expires=None,
+        discard=False,
+        comment=None,
+        comment_url=None,
+        rest={},
+    )
+
+
+def test_find_cookie_with_and_without_index():
+    """Indexed and unindexed jars give the same lookups."""
+    indexed, plain = CookieJar(), CookieJar()
+    for jar in (indexed, plain):
+        jar.set_cookie(_cookie("__session", "a", "higgsfield.ai"))
+        jar.set_cookie(_cookie("__session", "b", "clerk.higgsfield.ai"))
+    index_cookies(indexed, indexed)
+
+    for jar in (indexed, plain):
+        assert find_cookie(jar, jar, "__session", "clerk") == "b"
+        assert find_cookie(jar, jar, "__session", "nope") is None
+        assert find_cookie(jar, jar, "missing") is None
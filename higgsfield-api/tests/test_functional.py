@@ -1,11 +1,23 @@
 """Functional tests for Higgsfield API endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
 
 from src.main import app
 
-client = TestClient(app)
+# Share the session-scoped client's event loop (pytest-asyncio 0.23)
+pytestmark = pytest.mark.asyncio(scope="session")
+
+EXPECTED_ROUTES: frozenset[str] = frozenset(
+    {
+        "/api/higgsfield/t2i/",
+        "/api/higgsfield/soul/",
+        "/api/higgsfield/styles/",
+        "/api/higgsfield/i2v/",
+        "/api/task/{task_id}/status",
+        "/api/task/{task_id}/cancel",
+        "/api/task/{task_id}",
+    }
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -13,24 +25,24 @@ client = TestClient(app)
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_health_check():
+async def test_health_check(client):
     """Test health check endpoint with correct UUID."""
     # This test requires UUID_TEST_CHECK to be set in .test.env
-    response = client.get("/health/test-uuid")
+    response = await client.get("/health/test-uuid")
     # Will return 200 if UUID matches, 403 if it doesn't
     assert response.status_code in [200, 403]
 
 
-def test_health_check_wrong_uuid():
+async def test_health_check_wrong_uuid(client):
     """Test health check endpoint with wrong UUID."""
-    response = client.get("/health/wrong-uuid")
+    response = await client.get("/health/wrong-uuid")
     assert response.status_code == 403
 
 
-def test_api_root():
+async def test_api_root(client):
     """Test that API is accessible."""
     # This will likely return 404 or 401, but should not return 500
-    response = client.get("/api/")
+    response = await client.get("/api/")
     assert response.status_code != 500
 
 
@@ -39,22 +51,11 @@ def test_api_root():
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_routes_registered():
+async def test_routes_registered():
     """Ensure all expected endpoints are registered."""
-    paths = [route.path for route in client.app.routes]
-    
-    expected_routes = [
-        "/api/higgsfield/t2i/",
-        "/api/higgsfield/soul/",
-        "/api/higgsfield/styles/",
-        "/api/higgsfield/i2v/",
-        "/api/task/{task_id}/status",
-        "/api/task/{task_id}/cancel",
-        "/api/task/{task_id}",
-    ]
-    
-    for route in expected_routes:
-        assert route in paths, f"Route {route} not found in registered routes"
+    paths = {route.path for route in app.routes}
+    missing = EXPECTED_ROUTES - paths
+    assert not missing, f"Routes not found in registered routes: {sorted(missing)}"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -62,9 +63,9 @@ def test_routes_registered():
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_styles_endpoint_returns_list():
+async def test_styles_endpoint_returns_list(client):
     """Test that /styles/ endpoint returns a list of styles."""
-    response = client.get("/api/higgsfield/styles/")
+    response = await client.get("/api/higgsfield/styles/")
     
     # Should return 200 (no auth required for listing styles)
     assert response.status_code == 200
@@ -76,9 +77,9 @@ def test_styles_endpoint_returns_list():
     assert data["total"] >= 0
 
 
-def test_styles_have_required_fields():
+async def test_styles_have_required_fields(client):
     """Test that each style has the required fields."""
-    response = client.get("/api/higgsfield/styles/")
+    response = await client.get("/api/higgsfield/styles/")
     assert response.status_code == 200
     
     data = response.json()
@@ -94,50 +95,55 @@ def test_styles_have_required_fields():
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_t2i_requires_auth():
-    """Test that /t2i/ endpoint requires authentication."""
-    response = client.post(
-        "/api/higgsfield/t2i/",
-        json={"prompt": "test prompt"}
-    )
-    # Should require auth (401 or 403)
-    assert response.status_code in [401, 403, 422]
-
-
-def test_soul_requires_auth():
-    """Test that /soul/ endpoint requires authentication."""
-    response = client.post(
-        "/api/higgsfield/soul/",
-        json={"prompt": "test prompt"}
-    )
+@pytest.mark.parametrize(
+    "method, path, kwargs, allowed_codes",
+    [
+        pytest.param(
+            "post",
+            "/api/higgsfield/t2i/",
+            {"json": {"prompt": "test prompt"}},
+            [401, 403, 422],
+            id="t2i",
+        ),
+        pytest.param(
+            "post",
+            "/api/higgsfield/soul/",
+            {"json": {"prompt": "test prompt"}},
+            [401, 403, 422],
+            id="soul",
+        ),
+        pytest.param(
+            "post",
+            "/api/higgsfield/i2v/",
+            # A minimal fake image file
+            {
+                "data": {"prompt": "test"},
+                "files": {"image": ("test.png", b"fake image data", "image/png")},
+            },
+            [401, 403, 422],
+            id="i2v",
+        ),
+        pytest.param(
+            "get",
+            "/api/task/00000000-0000-0000-0000-000000000000/status",
+            {},
+            [401, 403, 404],
+            id="task-status",
+        ),
+        pytest.param(
+            "post",
+            "/api/task/00000000-0000-0000-0000-000000000000/cancel",
+            {},
+            [401, 403, 404],
+            id="task-cancel",
+        ),
+    ],
+)
+async def test_endpoint_requires_auth(client, method, path, kwargs, allowed_codes):
+    """Test that protected endpoints require authentication."""
+    response = await getattr(client, method)(path, **kwargs)
     # Should require auth (401 or 403)
-    assert response.status_code in [401, 403, 422]
-
-
-def test_i2v_requires_auth():
-    """Test that /i2v/ endpoint requires authentication."""
-    # Create a minimal fake image file
-    response = client.post(
-        "/api/higgsfield/i2v/",
-        data={"prompt": "test"},
-        files={"image": ("test.png", b"fake image data", "image/png")}
-    )
-    # Should require auth (401 or 403)
-    assert response.status_code in [401, 403, 422]
-
-
-def test_task_status_requires_auth():
-    """Test that task status endpoint requires authentication."""
-    response = client.get("/api/task/00000000-0000-0000-0000-000000000000/status")
-    # Should require auth (401 or 403)
-    assert response.status_code in [401, 403, 404]
-
-
-def test_task_cancel_requires_auth():
-    """Test that task cancel endpoint requires authentication."""
-    response = client.post("/api/task/00000000-0000-0000-0000-000000000000/cancel")
-    # Should require auth (401 or 403)
-    assert response.status_code in [401, 403, 404]
+    assert response.status_code in allowed_codes
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -145,11 +151,14 @@ def test_task_cancel_requires_auth():
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_t2i_validates_request_body():
-    """Test that /t2i/ validates the request body."""
+@pytest.mark.parametrize(
+    "path", ["/api/higgsfield/t2i/", "/api/higgsfield/soul/"], ids=["t2i", "soul"]
+)
+async def test_validates_request_body(client, path):
+    """Test that generation endpoints validate the request body."""
     # Missing required 'prompt' field
-    response = client.post(
-        "/api/higgsfield/t2i/",
+    response = await client.post(
+        path,
         json={},
         headers={"X-API-KEY": "invalid-key"}  # Auth will fail but validation happens first
     )
@@ -157,39 +166,23 @@ def test_t2i_validates_request_body():
     assert response.status_code in [401, 403, 422]
 
 
-def test_soul_validates_request_body():
-    """Test that /soul/ validates the request body."""
-    # Missing required 'prompt' field
-    response = client.post(
-        "/api/higgsfield/soul/",
-        json={},
-        headers={"X-API-KEY": "invalid-key"}
-    )
-    # Should return 422 (validation error) or 401/403 (auth error)
-    assert response.status_code in [401, 403, 422]
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Enum Validation Tests
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def test_t2i_validates_aspect_ratio():
-    """Test that /t2i/ validates aspect_ratio enum."""
-    response = client.post(
-        "/api/higgsfield/t2i/",
-        json={"prompt": "test", "aspect_ratio": "invalid"},
-        headers={"X-API-KEY": "test"}
-    )
-    # Should return 422 for invalid enum or 401/403 for auth
-    assert response.status_code in [401, 403, 422]
-
-
-def test_soul_validates_resolution():
-    """Test that /soul/ validates resolution enum."""
-    response = client.post(
-        "/api/higgsfield/soul/",
-        json={"prompt": "test", "resolution": "invalid"},
+@pytest.mark.parametrize(
+    "path, field",
+    [
+        pytest.param("/api/higgsfield/t2i/", "aspect_ratio", id="t2i-aspect-ratio"),
+        pytest.param("/api/higgsfield/soul/", "resolution", id="soul-resolution"),
+    ],
+)
+async def test_validates_enum_fields(client, path, field):
+    """Test that generation endpoints reject invalid enum values."""
+    response = await client.post(
+        path,
+        json={"prompt": "test", field: "invalid"},
         headers={"X-API-KEY": "test"}
     )
     # Should return 422 for invalid enum or 401/403 for auth
@@ -0,0 +1,90 @@
+"""Tests for reading upload dimensions from image headers."""
+
+import struct
+
+import pytest
+
+from src.services.higgsfield import _peek_image_size, _read_image_size
+
+PNG = (
+    b"\x89PNG\r\n\x1a\n"
+    + b"\x00\x00\x00\rIHDR"
+    + struct.pack(">II", 3, 2)
+    + b"\x08\x02\x00\x00\x00\x00\x00\x00\x00"
+)
+
+
+def _jpeg(sof_marker: int) -> bytes:
+    """SOI, APP0 and a DHT segment ahead of the frame header, then SOS."""
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00\x01\x01\x00" + b"\x00" * 6
+    dht = b"\xff\xc4" + struct.pack(">H", 5) + b"\x00\x01\x00"
+    sof = (
+        bytes([0xFF, sof_marker])
+        + struct.pack(">HBHHB", 11, 8, 2, 3, 1)
+        + b"\x01\x11\x00"
+    )
+    sos = b"\xff\xda" + struct.pack(">H", 8) + b"\x01\x01\x00\x00\x3f\x00"
+    return b"\xff\xd8" + app0 + dht + sof + sos + b"\x00" * 8 + b"\xff\xd9"
+
+
+def _webp(chunk: bytes, payload: bytes) -> bytes:
+    body = b"WEBP" + chunk + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+WEBP_VP8 = _webp(
+    b"VP8 ", b"\x00\x00\x00\x9d\x01\x2a" + struct.pack("<HH", 3, 2) + b"\x00" * 4
+)
+WEBP_VP8L = _webp(
+    b"VP8L", b"\x2f" + ((3 - 1) | (2 - 1) << 14).to_bytes(4, "little") + b"\x00" * 8
+)
+WEBP_VP8X = _webp(
+    b"VP8X",
+    b"\x00\x00\x00\x00" + (3 - 1).to_bytes(3, "little") + (2 - 1).to_bytes(3, "little"),
+)
+
+# 3x2 GIF: no header parser, so it goes through the Pillow fallback
+GIF = (
+    b"GIF89a"
+    + struct.pack("<HH", 3, 2)
+    + b"\x80\x00\x00\x00\x00\x00\xff\xff\xff"
+    + b","
+    + struct.pack("<HHHH", 0, 0, 3, 2)
+    + b"\x00\x02\x02\x44\x01\x00;"
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [PNG, _jpeg(0xC0), _jpeg(0xC2), WEBP_VP8, WEBP_VP8L, WEBP_VP8X],
+    ids=[
+        "png",
+        "jpeg-baseline",
+        "jpeg-progressive",
+        "webp-vp8",
+        "webp-vp8l",
+        "webp-vp8x",
+    ],
+)
+def test_header_size(tmp_path, data):
+    """Supported formats are sized from the header alone."""
+    image_path = tmp_path / "image"
+    image_path.write_bytes(data)
+    assert _peek_image_size(image_path) == (3, 2)
+    assert _read_image_size(image_path) == (3, 2)
+
+
+def test_truncated_headers_are_not_parsed(tmp_path):
+    """Short or corrupt headers fall through instead of raising or looping."""
+    image_path = tmp_path / "image"
+    for data in (PNG[:20], b"\xff\xd8\xff\xe0\x00\x00"):
+        image_path.write_bytes(data)
+        assert _peek_image_size(image_path) is None
+
+
+def test_gif_uses_pillow_fallback(tmp_path):
+    """Formats without a header parser are sized by Pillow."""
+    image_path = tmp_path / "image.gif"
+    image_path.write_bytes(GIF)
+    assert _peek_image_size(image_path) is None
+    assert _read_image_size(image_path) == (3, 2)
@@ -0,0 +1,82 @@
+"""Tests for request signing helpers."""
+
+import hashlib
+import hmac
+
+from src.utils.security import (
+    create_hmac_sha256_signature,
+    create_hmac_sha256_signature_file,
+    create_hmac_sha256_signature_precomputed,
+    create_hmac_sha256_signature_stream,
+    create_hmac_sha256_signatures_batch,
+    derive_signing_key,
+)
+
+
+def _reference_signature(key: str, data: str, message: str = "MusicAPI") -> str:
+    """Two-stage signature as originally implemented with hmac.new()."""
+    derived = hmac.new(key.encode(), message.encode(), hashlib.sha256).hexdigest()
+    return hmac.new(derived.encode(), data.encode(), hashlib.sha256).hexdigest()
+
+
+def test_signature_fixed_vector():
+    """Signature for a known input stays byte-for-byte stable."""
+    signature = create_hmac_sha256_signature("secret", '{"task_id": "abc"}')
+    assert signature == _reference_signature("secret", '{"task_id": "abc"}')
+    assert (
+        signature == "fc0b518507a1056dd8c9da09c6c0d4a41ffe61d3a9c7cf6382e59f43df8324b5"
+    )
+
+
+def test_signature_matches_reference_with_custom_message():
+    """A custom derivation message is honoured the same way as before."""
+    assert create_hmac_sha256_signature(
+        "k€y", "päyload", message="Other"
+    ) == _reference_signature("k€y", "päyload", message="Other")
+
+
+def test_precomputed_signature_matches():
+    """Signing with a pre-derived key gives the same result as the full helper."""
+    derived_key = derive_signing_key("secret", "MusicAPI")
+    assert create_hmac_sha256_signature_precomputed(
+        derived_key, "payload"
+    ) == create_hmac_sha256_signature("secret", "payload")
+
+
+def test_raw_key_signature_opt_in():
+    """legacy_hex_key=False signs with the raw intermediate digest."""
+    raw_key = hmac.digest(b"secret", b"MusicAPI", "sha256")
+    expected = hmac.digest(raw_key, b"payload", "sha256").hex()
+    signature = create_hmac_sha256_signature("secret", "payload", legacy_hex_key=False)
+    assert signature == expected
+    assert signature != create_hmac_sha256_signature("secret", "payload")
+
+
+def test_batch_signatures_match_single():
+    """Batch signing returns the per-payload signatures in order."""
+    payloads = ["first", "second", ""]
+    derived_key = derive_signing_key("secret", "MusicAPI")
+    assert create_hmac_sha256_signatures_batch(derived_key, payloads) == [
+        create_hmac_sha256_signature("secret", payload) for payload in payloads
+    ]
+
+
+def test_stream_and_file_signatures_match_single(tmp_path):
+    """Chunked and file-backed signing agree with the one-shot helper."""
+    payload = "x" * 100_000 + "päyload"
+    derived_key = derive_signing_key("secret", "MusicAPI")
+    expected = create_hmac_sha256_signature("secret", payload)
+
+    data = payload.encode()
+    chunks = (data[i : i + 4096] for i in range(0, len(data), 4096))
+    assert create_hmac_sha256_signature_stream(derived_key, chunks) == expected
+
+    payload_file = tmp_path / "payload.bin"
+    payload_file.write_bytes(data)
+    assert create_hmac_sha256_signature_file(derived_key, payload_file) == expected
+
+    empty_file = tmp_path / "empty.bin"
+    empty_file.write_bytes(b"")
+    assert create_hmac_sha256_signature_file(
+        derived_key, empty_file
+    ) == create_hmac_sha256_signature("secret", "")